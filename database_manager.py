@@ -2,6 +2,7 @@ import streamlit as st
 import sqlite3
 import json
 import pandas as pd
+import numpy as np
 from typing import Dict, List, Optional, Tuple
 import os
 
@@ -158,11 +159,18 @@ class SQLitePlayerDatabase:
             attempts_json = json.dumps(attempts or {})
             original_games = original_games or games_played
             
-            # Use INSERT OR REPLACE to handle both new and existing players
+            # Upsert in place so existing rows keep their id and created_at
             cursor.execute('''
-                INSERT OR REPLACE INTO players 
-                (name, percentages, made_shots, attempts, games_played, original_games, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                INSERT INTO players 
+                (name, percentages, made_shots, attempts, games_played, original_games)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(name) DO UPDATE SET
+                    percentages = excluded.percentages,
+                    made_shots = excluded.made_shots,
+                    attempts = excluded.attempts,
+                    games_played = excluded.games_played,
+                    original_games = excluded.original_games,
+                    updated_at = CURRENT_TIMESTAMP
             ''', (player_name, percentages_json, made_shots_json, attempts_json, 
                   games_played, original_games))
             
@@ -275,15 +283,13 @@ class SQLitePlayerDatabase:
     def remove_player(self, player_name: str) -> bool:
         """Remove a player from the database."""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            conn = self.get_connection()
             
-            cursor.execute('DELETE FROM players WHERE name = ?', (player_name,))
-            conn.commit()
-            success = cursor.rowcount > 0
-            conn.close()
+            # Single transaction on the shared connection
+            with conn:
+                cursor = conn.execute('DELETE FROM players WHERE name = ?', (player_name,))
             
-            return success
+            return cursor.rowcount > 0
             
         except Exception as e:
             st.error(f"Error removing player {player_name}: {e}")
@@ -293,10 +299,14 @@ class SQLitePlayerDatabase:
         """Clear all players from the database."""
         try:
             conn = self.get_connection()
-            cursor = conn.cursor()
             
-            cursor.execute('DELETE FROM players')
-            conn.commit()
+            # One write transaction for the delete and the AUTOINCREMENT reset
+            conn.executescript('''
+                BEGIN IMMEDIATE;
+                DELETE FROM players;
+                DELETE FROM sqlite_sequence WHERE name = 'players';
+                COMMIT;
+            ''')
             
             return True
             
@@ -345,14 +355,12 @@ class SQLitePlayerDatabase:
         
         scale_factor = target_games / original_games
         
-        scaled_made = {}
-        scaled_attempts = {}
+        # Scale each dict's zones in one rounded multiply (np.rint rounds half to even, like round)
+        made_values = np.fromiter(made_shots.values(), dtype=np.float64, count=len(made_shots))
+        attempt_values = np.fromiter(attempts.values(), dtype=np.float64, count=len(attempts))
         
-        for zone in made_shots:
-            scaled_made[zone] = round(made_shots[zone] * scale_factor)
-            
-        for zone in attempts:
-            scaled_attempts[zone] = round(attempts[zone] * scale_factor)
+        scaled_made = dict(zip(made_shots, np.rint(made_values * scale_factor).astype(np.int64).tolist()))
+        scaled_attempts = dict(zip(attempts, np.rint(attempt_values * scale_factor).astype(np.int64).tolist()))
         
         return scaled_made, scaled_attempts
     
@@ -79,7 +79,7 @@ def get_player_database():
     return PlayerDatabase()
 
 # Initialize our classes with TTL for memory management
-@st.cache_resource(ttl=3600)  # Cache for 1 hour
+@st.cache_resource  # One instance for all sessions (keeps OCR handle and result cache warm)
 def get_ocr_extractor():
     return ShotChartOCR()
 
@@ -1,44 +1,92 @@
 import pytesseract
 import cv2
 import numpy as np
-from PIL import Image
+import hashlib
+import os
 import re
-from typing import List, Dict, Tuple
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Dict, Tuple, Optional
+
+try:
+    import tesserocr
+except ImportError:  # Fall back to the pytesseract subprocess
+    tesserocr = None
 
 
 class ShotChartOCR:
     """OCR extractor for basketball shot chart images."""
     
+    # Characters that can appear in shot chart stats
+    CHAR_WHITELIST = '0123456789./%NAna'
+    
+    # LSTM-only engine, single uniform block of text
+    TESSERACT_CONFIG = f'--oem 1 --psm 6 -c tessedit_char_whitelist={CHAR_WHITELIST}'
+    
+    # Longest image side fed to Tesseract; stat labels stay legible below this
+    MAX_OCR_DIMENSION = 1600
+    
+    # White border (px) kept around the cropped chart; Tesseract misreads text flush with the edge
+    CROP_PADDING = 10
+    
+    # Number of shot charts whose OCR results are memoized per instance
+    RESULT_CACHE_SIZE = 64
+    
+    # Made/attempts ("27/70"), percentages ("38.6%"), N/A markers,
+    # decimals ("38.6") and short numbers that could be stats
+    STAT_PATTERN = re.compile(r'^(?:\d+/\d+|\d+\.?\d*%|NA|N/A|na|n/a|\d+\.\d+|\d{1,3})$')
+    
     def __init__(self):
         # Configure pytesseract if needed (adjust path for your system)
         # pytesseract.pytesseract.tesseract_cmd = r'/usr/local/bin/tesseract'  # macOS
-        pass
+        
+        # LRU of final results keyed by a hash of the image bytes
+        self._result_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        # Keep one in-process Tesseract handle so the LSTM model stays loaded
+        self._api = None
+        self._api_lock = threading.Lock()
+        if tesserocr is not None:
+            try:
+                self._api = tesserocr.PyTessBaseAPI(psm=tesserocr.PSM.SINGLE_BLOCK, oem=tesserocr.OEM.LSTM_ONLY)
+                self._api.SetVariable('tessedit_char_whitelist', self.CHAR_WHITELIST)
+            except RuntimeError:  # e.g. missing tessdata or language; fall back to pytesseract
+                self._api = None
+    
+    def load_image(self, image_path: str) -> np.ndarray:
+        """Decode a shot chart once, straight to grayscale."""
+        with open(image_path, 'rb') as f:
+            return self.decode_image(f.read(), image_path)
+    
+    def decode_image(self, raw: bytes, image_path: str = '<bytes>') -> np.ndarray:
+        """Decode encoded image bytes straight to grayscale."""
+        # Decode straight to grayscale (no intermediate BGR buffer)
+        gray = cv2.imdecode(np.frombuffer(raw, dtype=np.uint8), cv2.IMREAD_GRAYSCALE)
+        if gray is None:
+            raise ValueError(f"Could not read image: {image_path}")
+        return gray
     
     def preprocess_image(self, image_path: str) -> np.ndarray:
         """Preprocess image for better OCR results."""
-        # Read image
-        img = cv2.imread(image_path)
-        
-        # Convert to grayscale
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        # Read image as grayscale
+        gray = self.load_image(image_path)
         
         # Apply threshold to get binary image
         _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
         
-        # Apply morphological operations to clean up
-        kernel = np.ones((1, 1), np.uint8)
-        cleaned = cv2.morphologyEx(thresh, cv2.MORPH_CLOSE, kernel)
-        
-        return cleaned
+        return thresh
     
     def preprocess_image_optimized(self, image_path: str) -> np.ndarray:
         """Optimized single preprocessing method for better performance."""
-        # Read image
-        img = cv2.imread(image_path)
-        
-        # Convert to grayscale
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        # Read image as grayscale
+        gray = self.load_image(image_path)
         
+        return self.binarize(gray)
+    
+    def binarize(self, gray: np.ndarray) -> np.ndarray:
+        """Blur and Otsu-threshold a grayscale shot chart."""
         # Apply Gaussian blur to reduce noise
         blurred = cv2.GaussianBlur(gray, (3, 3), 0)
         
@@ -49,211 +97,209 @@ class ShotChartOCR:
     
     def is_basketball_stat(self, text: str) -> bool:
         """Check if text looks like basketball statistics."""
-        text = text.strip()
-        
-        # Handle empty text
-        if not text:
-            return False
-        
-        # Pattern for made/attempts (e.g., "27/70", "5/12")
-        made_attempts_pattern = r'^\d+/\d+$'
-        
-        # Pattern for percentages (e.g., "38.6%", "45%")
-        percentage_pattern = r'^\d+\.?\d*%$'
-        
-        # Pattern for simple numbers that could be stats
-        number_pattern = r'^\d+$'
-        
-        # Pattern for "NA" or "N/A" (not available)
-        na_pattern = r'^(NA|N/A|na|n/a)$'
-        
-        # Pattern for decimal numbers without %
-        decimal_pattern = r'^\d+\.\d+$'
-        
-        return (re.match(made_attempts_pattern, text) or 
-                re.match(percentage_pattern, text) or
-                re.match(na_pattern, text) or
-                re.match(decimal_pattern, text) or
-                (re.match(number_pattern, text) and len(text) <= 3))
+        return bool(self.STAT_PATTERN.match(text.strip()))
     
-    def extract_text_with_positions(self, image_path: str) -> List[Dict]:
-        """Extract text and their positions from shot chart image."""
-        # Use single optimized preprocessing
-        processed_img = self.preprocess_image_optimized(image_path)
-        
-        # Use pytesseract to get data with optimized config
-        custom_config = r'--oem 3 --psm 6 -c tessedit_char_whitelist=0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz./% '
-        data = pytesseract.image_to_data(processed_img, config=custom_config, output_type=pytesseract.Output.DICT)
-        
-        extractions = []
-        
-        for i in range(len(data['text'])):
-            text = data['text'][i].strip()
-            confidence = int(data['conf'][i])
+    def prepare_for_ocr(self, gray: np.ndarray) -> Tuple[np.ndarray, float, Tuple[int, int]]:
+        """Downscale and crop a grayscale chart, returning the scale and crop offset."""
+        # Tesseract cost grows with pixel count; cap the longest side
+        height, width = gray.shape[:2]
+        scale = min(1.0, self.MAX_OCR_DIMENSION / max(height, width))
+        if scale < 1.0:
+            gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        
+        # Trim the near-white margin around the chart, keeping a small border
+        offset = (0, 0)
+        content = cv2.findNonZero((gray < 245).astype(np.uint8))
+        if content is not None:
+            x, y, w, h = cv2.boundingRect(content)
+            pad = self.CROP_PADDING
+            x0, y0 = max(x - pad, 0), max(y - pad, 0)
+            x1, y1 = min(x + w + pad, gray.shape[1]), min(y + h + pad, gray.shape[0])
+            gray = gray[y0:y1, x0:x1]
+            offset = (x0, y0)
+        
+        return gray, scale, offset
+    
+    def run_ocr(self, image_path: str, gray: Optional[np.ndarray] = None) -> Dict[str, List]:
+        """Run a single Tesseract pass over the preprocessed shot chart."""
+        # Reuse an already decoded image when one is provided
+        if gray is None:
+            gray = self.load_image(image_path)
+        
+        # Shrink the OCR input before binarizing
+        gray, scale, (offset_x, offset_y) = self.prepare_for_ocr(gray)
+        processed_img = self.binarize(gray)
+        
+        if self._api is not None:
+            data = self._recognize_words(processed_img)
+        else:
+            data = pytesseract.image_to_data(processed_img, config=self.TESSERACT_CONFIG, output_type=pytesseract.Output.DICT)
+        
+        # Map boxes back to original image pixels for the zone definitions
+        if scale < 1.0 or offset_x or offset_y:
+            data['left'] = [round((x + offset_x) / scale) for x in data['left']]
+            data['top'] = [round((y + offset_y) / scale) for y in data['top']]
+            data['width'] = [round(w / scale) for w in data['width']]
+            data['height'] = [round(h / scale) for h in data['height']]
+        
+        return data
+    
+    def _recognize_words(self, img: np.ndarray) -> Dict[str, List]:
+        """Recognize words with the resident tesserocr handle in image_to_data format."""
+        data = {'text': [], 'conf': [], 'left': [], 'top': [], 'width': [], 'height': []}
+        level = tesserocr.RIL.WORD
+        
+        # The handle is shared across Streamlit sessions and is not thread-safe
+        with self._api_lock:
+            # Hand the raw 8-bit buffer over directly; SetImage would round-trip a PIL image through BMP
+            img = np.ascontiguousarray(img, dtype=np.uint8)
+            height, width = img.shape[:2]
+            self._api.SetImageBytes(img.tobytes(), width, height, 1, width)
+            self._api.Recognize()
             
-            # Use consistent confidence threshold
-            if confidence > 25 and text and self.is_basketball_stat(text):
-                x = data['left'][i]
-                y = data['top'][i]
-                width = data['width'][i]
-                height = data['height'][i]
+            for word in tesserocr.iterate_level(self._api.GetIterator(), level):
+                text = word.GetUTF8Text(level)
+                box = word.BoundingBox(level)
+                if not text or box is None:
+                    continue
                 
-                extractions.append({
-                    'text': text,
-                    'x': x,
-                    'y': y,
-                    'width': width,
-                    'height': height,
-                    'confidence': confidence,
-                    'center_x': x + width // 2,
-                    'center_y': y + height // 2,
-                    'method': 'optimized_preprocessing'
-                })
-        
-        return extractions
+                x1, y1, x2, y2 = box
+                data['text'].append(text)
+                data['conf'].append(word.Confidence(level))
+                data['left'].append(x1)
+                data['top'].append(y1)
+                data['width'].append(x2 - x1)
+                data['height'].append(y2 - y1)
+        
+        return data
     
-    def extract_from_original_image(self, image_path: str) -> List[Dict]:
-        """Extract text directly from original image without preprocessing."""
-        # Read original image
-        img = Image.open(image_path)
+    def extract_text_with_positions(self, image_path: str, data: Optional[Dict[str, List]] = None) -> List[Dict]:
+        """Extract text and their positions from shot chart image."""
+        # Reuse an existing OCR pass when one is provided
+        if data is None:
+            data = self.run_ocr(image_path)
         
-        # Use pytesseract to get data with custom config
-        custom_config = r'--oem 3 --psm 6 -c tessedit_char_whitelist=0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz./% '
-        data = pytesseract.image_to_data(img, config=custom_config, output_type=pytesseract.Output.DICT)
+        # Use consistent confidence threshold
+        return self._build_records(data, 25, self.is_basketball_stat, 'optimized_preprocessing')
+    
+    def extract_from_original_image(self, image_path: str, gray: Optional[np.ndarray] = None) -> List[Dict]:
+        """Extract text directly from original image without preprocessing."""
+        # Reuse the decoded image shared with the preprocessing path
+        img = gray if gray is not None else self.load_image(image_path)
         
-        extracted_data = []
+        # Use pytesseract to get data with the shared config
+        data = pytesseract.image_to_data(img, config=self.TESSERACT_CONFIG, output_type=pytesseract.Output.DICT)
         
-        for i in range(len(data['text'])):
-            text = data['text'][i].strip()
-            confidence = int(data['conf'][i])
-            
-            # Lower confidence threshold for original image
-            if confidence > 15 and text and self.is_basketball_stat(text):
-                x = data['left'][i]
-                y = data['top'][i]
-                width = data['width'][i]
-                height = data['height'][i]
-                
-                extracted_data.append({
-                    'text': text,
-                    'x': x,
-                    'y': y,
-                    'width': width,
-                    'height': height,
-                    'confidence': confidence,
-                    'center_x': x + width // 2,
-                    'center_y': y + height // 2,
-                    'method': 'original'
-                })
-        
-        return extracted_data
+        # Lower confidence threshold for original image
+        return self._build_records(data, 15, self.is_basketball_stat, 'original')
     
     def remove_duplicates(self, results: List[Dict]) -> List[Dict]:
         """Remove duplicate detections based on position and text similarity."""
         if not results:
             return results
         
-        unique_results = []
         tolerance = 20  # pixels tolerance for considering positions similar
         
-        for result in results:
-            is_duplicate = False
-            
-            for existing in unique_results:
-                # Check if positions are close and text is similar
-                x_diff = abs(result['center_x'] - existing['center_x'])
-                y_diff = abs(result['center_y'] - existing['center_y'])
-                
-                if (x_diff <= tolerance and y_diff <= tolerance and 
-                    result['text'] == existing['text']):
-                    # Keep the one with higher confidence
-                    if result['confidence'] > existing['confidence']:
-                        unique_results.remove(existing)
-                        unique_results.append(result)
-                    is_duplicate = True
-                    break
-            
-            if not is_duplicate:
-                unique_results.append(result)
-        
-        return unique_results
+        centers = np.array([(r['center_x'], r['center_y']) for r in results], dtype=np.float32)
+        texts = np.array([r['text'] for r in results])
+        confidences = np.array([r['confidence'] for r in results], dtype=np.float32)
+        
+        # Pairwise duplicate mask: same text and both offsets within tolerance
+        close = (np.abs(centers[:, None, :] - centers[None, :, :]) <= tolerance).all(axis=2)
+        duplicates = close & (texts[:, None] == texts[None, :])
+        
+        # Connected components by propagating the smallest index through the mask
+        labels = np.arange(len(results))
+        while True:
+            new_labels = np.where(duplicates, labels[None, :], len(results)).min(axis=1)
+            if np.array_equal(new_labels, labels):
+                break
+            labels = new_labels
+        
+        # Keep the highest-confidence detection of each component (earliest on ties)
+        order = np.lexsort((np.arange(len(results)), -confidences, labels))
+        first_in_group = np.ones(len(order), dtype=bool)
+        first_in_group[1:] = labels[order][1:] != labels[order][:-1]
+        keep = np.sort(order[first_in_group])
+        
+        return [results[i] for i in keep]
     
-    def detect_missing_zones(self, image_path: str, detected_stats: List[Dict]) -> List[Dict]:
-        """Detect zones that might have N/A values by looking for missing data and faint text."""
-        from PIL import Image, ImageEnhance
-        
-        # Load image for enhanced OCR
-        img = Image.open(image_path)
-        
-        # Try with extreme contrast enhancement for faint N/A text
-        enhancer = ImageEnhance.Contrast(img)
-        high_contrast = enhancer.enhance(3.0)
-        brightness_enhancer = ImageEnhance.Brightness(high_contrast)
-        bright_img = brightness_enhancer.enhance(1.5)
-        
-        # Very aggressive OCR settings for N/A detection
-        na_candidates = []
-        configs = [
-            r'--oem 3 --psm 8 -c tessedit_char_whitelist=NAna/',
-            r'--oem 3 --psm 7 -c tessedit_char_whitelist=NAna/',
+    def is_na_candidate(self, text: str) -> bool:
+        """Check if text could be a faint or partially read N/A marker."""
+        text_upper = text.upper()
+        return (text_upper in ['N/A', 'NA', 'N', 'A', '/'] or 
+                ('N' in text_upper and 'A' in text_upper))
+    
+    def extract_na_candidates(self, data: Dict[str, List]) -> List[Dict]:
+        """Collect faint N/A-like tokens from an existing OCR pass."""
+        # Very low threshold
+        return self._build_records(data, 5, self.is_na_candidate, 'na_detection')
+    
+    def _build_records(self, data: Dict[str, List], min_confidence: int,
+                       accept: Callable[[str], bool], method: str) -> List[Dict]:
+        """Filter OCR tokens column-wise and build result dicts for the kept ones."""
+        texts = [text.strip() for text in data['text']]
+        confidences = np.asarray(data['conf'], dtype=np.float64).astype(np.int32)
+        
+        # Cheap confidence mask first, then the text check on the survivors
+        candidates = np.flatnonzero(confidences > min_confidence).tolist()
+        kept = np.array([i for i in candidates if texts[i] and accept(texts[i])], dtype=np.intp)
+        
+        left = np.asarray(data['left'], dtype=np.int32)[kept]
+        top = np.asarray(data['top'], dtype=np.int32)[kept]
+        width = np.asarray(data['width'], dtype=np.int32)[kept]
+        height = np.asarray(data['height'], dtype=np.int32)[kept]
+        center_x = left + width // 2
+        center_y = top + height // 2
+        
+        # Convert back to Python ints so results stay JSON/pickle friendly
+        columns = zip(kept.tolist(), left.tolist(), top.tolist(), width.tolist(), height.tolist(),
+                      confidences[kept].tolist(), center_x.tolist(), center_y.tolist())
+        
+        return [
+            {
+                'text': texts[i],
+                'x': x,
+                'y': y,
+                'width': w,
+                'height': h,
+                'confidence': conf,
+                'center_x': cx,
+                'center_y': cy,
+                'method': method
+            }
+            for i, x, y, w, h, conf, cx, cy in columns
         ]
+    
+    def _points_in_boxes(self, results: List[Dict], bounds: np.ndarray) -> np.ndarray:
+        """Return a (boxes, results) mask of result centers inside each (x0, x1, y0, y1) box."""
+        center_x = np.array([r['center_x'] for r in results])[None, :]
+        center_y = np.array([r['center_y'] for r in results])[None, :]
         
-        for config in configs:
-            try:
-                data = pytesseract.image_to_data(bright_img, config=config, output_type=pytesseract.Output.DICT)
-                
-                for i in range(len(data['text'])):
-                    text = data['text'][i].strip()
-                    confidence = int(data['conf'][i])
-                    
-                    if confidence > 5 and text:  # Very low threshold
-                        text_upper = text.upper()
-                        if (text_upper in ['N/A', 'NA', 'N', 'A', '/'] or 
-                            ('N' in text_upper and 'A' in text_upper)):
-                            
-                            x = data['left'][i]
-                            y = data['top'][i]
-                            width = data['width'][i]
-                            height = data['height'][i]
-                            
-                            na_candidates.append({
-                                'text': text,
-                                'x': x,
-                                'y': y,
-                                'width': width,
-                                'height': height,
-                                'confidence': confidence,
-                                'center_x': x + width // 2,
-                                'center_y': y + height // 2,
-                                'method': 'na_detection'
-                            })
-            except Exception:
-                continue
-        
+        return ((center_x >= bounds[:, 0:1]) & (center_x <= bounds[:, 1:2]) &
+                (center_y >= bounds[:, 2:3]) & (center_y <= bounds[:, 3:4]))
+    
+    def detect_missing_zones(self, detected_stats: List[Dict], na_candidates: List[Dict]) -> List[Dict]:
+        """Detect zones that might have N/A values by looking for missing data and faint text."""
         # Define expected zones based on typical shot chart layout
         expected_zones = [
             {'name': 'Left Mid Range', 'x_range': (100, 280), 'y_range': (220, 340)},
             {'name': 'Right Mid Range', 'x_range': (470, 650), 'y_range': (220, 340)},
             {'name': 'Free Throw Line Center', 'x_range': (300, 450), 'y_range': (180, 280)},
         ]
+        bounds = np.array([zone['x_range'] + zone['y_range'] for zone in expected_zones])
+        
+        # (zones, points) membership masks in one broadcast each
+        stats_mask = self._points_in_boxes(detected_stats, bounds)
+        candidates_mask = self._points_in_boxes(na_candidates, bounds)
+        empty_zones = ~stats_mask.any(axis=1)
         
         inferred_nas = []
         
-        for zone in expected_zones:
-            # Check if we have any stats in this zone
-            stats_in_zone = []
-            for stat in detected_stats:
-                if (zone['x_range'][0] <= stat['center_x'] <= zone['x_range'][1] and
-                    zone['y_range'][0] <= stat['center_y'] <= zone['y_range'][1]):
-                    stats_in_zone.append(stat)
-            
-            if not stats_in_zone:
+        for zone, is_empty, in_zone in zip(expected_zones, empty_zones, candidates_mask):
+            if is_empty:
                 # Look for N/A candidates in this zone
-                candidates_in_zone = []
-                for candidate in na_candidates:
-                    if (zone['x_range'][0] <= candidate['center_x'] <= zone['x_range'][1] and
-                        zone['y_range'][0] <= candidate['center_y'] <= zone['y_range'][1]):
-                        candidates_in_zone.append(candidate)
+                candidates_in_zone = [na_candidates[i] for i in np.flatnonzero(in_zone)]
                 
                 if candidates_in_zone:
                     # Found actual N/A text in this zone
@@ -281,27 +327,75 @@ class ShotChartOCR:
     
     def extract_basketball_stats(self, image_path: str) -> List[Dict]:
         """Main method to extract basketball statistics from shot chart."""
-        # Use optimized single preprocessing method
-        preprocessed_results = self.extract_text_with_positions(image_path)
+        with open(image_path, 'rb') as f:
+            raw = f.read()
+        
+        # Identical image bytes always give identical results
+        key = hashlib.blake2b(raw, digest_size=16).digest()
+        with self._cache_lock:
+            cached = self._result_cache.get(key)
+            if cached is not None:
+                self._result_cache.move_to_end(key)
+        if cached is not None:
+            return [dict(result) for result in cached]
+        
+        # Decode once and run a single Tesseract pass shared by stat and N/A extraction
+        gray = self.decode_image(raw, image_path)
+        data = self.run_ocr(image_path, gray)
+        preprocessed_results = self.extract_text_with_positions(image_path, data)
         
         # Remove duplicates
         unique_results = self.remove_duplicates(preprocessed_results)
         
-        # Detect missing zones and N/A values (simplified)
-        na_results = self.detect_missing_zones(image_path, unique_results)
+        # Detect missing zones and N/A values from the same OCR output
+        na_candidates = self.extract_na_candidates(data)
+        na_results = self.detect_missing_zones(unique_results, na_candidates)
         
         # Combine all results
         final_results = unique_results + na_results
         
         # Sort by position (top to bottom, left to right)
-        return sorted(final_results, key=lambda x: (x['center_y'], x['center_x']))
+        center_x = np.array([r['center_x'] for r in final_results])
+        center_y = np.array([r['center_y'] for r in final_results])
+        final_results = [final_results[i] for i in np.lexsort((center_x, center_y))]
+        
+        with self._cache_lock:
+            self._result_cache[key] = [dict(result) for result in final_results]
+            if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        
+        return final_results
+    
+    def extract_batch(self, image_paths: List[str], max_workers: Optional[int] = None) -> List[List[Dict]]:
+        """Extract basketball statistics from several shot charts concurrently."""
+        # Tesseract and OpenCV release the GIL, so threads overlap the heavy work
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            return list(executor.map(self.extract_basketball_stats, image_paths))
+
+
+_shared_ocr = None
+_shared_ocr_lock = threading.Lock()
+
+
+def get_shared_ocr() -> ShotChartOCR:
+    """Return a process-wide ShotChartOCR instance, creating it on first use."""
+    global _shared_ocr
+    with _shared_ocr_lock:
+        if _shared_ocr is None:
+            _shared_ocr = ShotChartOCR()
+        return _shared_ocr
 
 
 if __name__ == "__main__":
-    # Test the OCR extractor
-    ocr = ShotChartOCR()
-    results = ocr.extract_basketball_stats("shot_charts/marina_mabrey.jpeg")
+    # Test the OCR extractor on every sample shot chart
+    ocr = get_shared_ocr()
+    image_paths = sorted(
+        os.path.join("shot_charts", f) for f in os.listdir("shot_charts")
+        if f.endswith(('.jpg', '.jpeg', '.png'))
+    )
+    all_results = ocr.extract_batch(image_paths)
     
-    print("Extracted Basketball Statistics:")
-    for result in results:
-        print(f"Text: {result['text']}, Position: ({result['center_x']}, {result['center_y']}), Confidence: {result['confidence']}, Method: {result['method']}") 
\ No newline at end of file
+    for image_path, results in zip(image_paths, all_results):
+        print(f"Extracted Basketball Statistics: {image_path}")
+        for result in results:
+            print(f"Text: {result['text']}, Position: ({result['center_x']}, {result['center_y']}), Confidence: {result['confidence']}, Method: {result['method']}")
@@ -1,7 +1,15 @@
+import os
+import matplotlib
+
+# Scripted/batch runs can skip GUI backend setup entirely
+HEADLESS = os.environ.get('CHART2RADAR_HEADLESS') == '1'
+if HEADLESS:
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.collections import PolyCollection
 from typing import Dict, List, Optional, Tuple
-import matplotlib.patches as patches
 
 
 class RadarChartPlotter:
@@ -16,31 +24,42 @@ class RadarChartPlotter:
         
         # Colors for different players
         self.colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b']
+        
+        # Zone layout is fixed, so build labels and angles once
+        self.zone_labels = [zone.replace(' ', '\n') for zone in self.standard_zones]  # Break long labels
+        self.angles = np.linspace(0, 2 * np.pi, len(self.standard_zones), endpoint=False)
+        self.closed_angles = self.close_ring(self.angles)  # Close the plot
+        self.theta_degrees = np.degrees(self.angles)  # Polar grid positions for set_thetagrids
+    
+    @staticmethod
+    def close_ring(values: np.ndarray) -> np.ndarray:
+        """Repeat the first value along the last axis so each radar ring closes."""
+        closed = np.empty(values.shape[:-1] + (values.shape[-1] + 1,), dtype=values.dtype)
+        closed[..., :-1] = values
+        closed[..., -1] = values[..., 0]
+        
+        return closed
     
-    def prepare_data_for_radar(self, zone_percentages: Dict[str, float]) -> Tuple[List[str], List[float]]:
+    def prepare_data_for_radar(self, zone_percentages: Dict[str, float]) -> Tuple[List[str], np.ndarray]:
         """Prepare data in the correct order for radar chart."""
-        labels = []
-        values = []
+        values = np.fromiter((zone_percentages.get(zone, 0.0) for zone in self.standard_zones),
+                             dtype=np.float64, count=len(self.standard_zones))
         
-        for zone in self.standard_zones:
-            labels.append(zone.replace(' ', '\n'))  # Break long labels
-            values.append(zone_percentages.get(zone, 0.0))
+        return self.zone_labels, values
+    
+    def prepare_matrix_for_radar(self, player_data: Dict[str, Dict[str, float]]) -> Tuple[List[str], np.ndarray]:
+        """Gather every player's zone values into a (players, zones) matrix."""
+        values_mat = np.array([[zone_data.get(zone, 0.0) for zone in self.standard_zones]
+                               for zone_data in player_data.values()], dtype=np.float64)
         
-        return labels, values
+        return self.zone_labels, values_mat.reshape(len(player_data), len(self.standard_zones))
     
     def create_radar_subplot(self, fig, position, title: str = "") -> Tuple:
         """Create a radar chart subplot."""
         ax = fig.add_subplot(position, projection='polar')
         ax.set_title(title, size=16, fontweight='bold', pad=20)
         
-        # Set up the angle for each zone
-        num_zones = len(self.standard_zones)
-        angles = np.linspace(0, 2 * np.pi, num_zones, endpoint=False).tolist()
-        
-        # Close the plot
-        angles += angles[:1]
-        
-        return ax, angles
+        return ax, self.closed_angles.tolist()
     
     def plot_single_player_radar(self, 
                                 zone_data: Dict[str, float], 
@@ -49,31 +68,66 @@ class RadarChartPlotter:
                                 color: str = '#1f77b4',
                                 save_path: Optional[str] = None,
                                 use_made_shots: bool = False,
-                                data_type_name: str = "Made Shots") -> plt.Figure:
-        """Create a radar chart for a single player."""
+                                data_type_name: str = "Made Shots",
+                                close_after_save: bool = False) -> Optional[plt.Figure]:
+        """Create a radar chart for a single player.
         
-        labels, values = self.prepare_data_for_radar(zone_data)
+        Batch callers that only need the saved file should pass close_after_save=True,
+        which closes the figure after saving and returns None.
+        """
+        fig, ax = self.prepare_template()
+        
+        return self.render_into(fig, ax, zone_data, player_name, title, color, save_path,
+                                use_made_shots, data_type_name, close_after_save)
+    
+    def prepare_template(self) -> Tuple[plt.Figure, plt.Axes]:
+        """Create a single-player radar figure with its static styling (zone grid, axes).
         
-        # Create figure
+        Pass the result to render_into repeatedly to draw many players without rebuilding
+        the figure, axes and tick labels each time. The radial scale is set by each
+        render_into call, so one template serves percentage and count renders alike.
+        """
         fig, ax = plt.subplots(figsize=(10, 10), subplot_kw=dict(projection='polar'))
         
-        # Set up angles
-        num_zones = len(values)
-        angles = np.linspace(0, 2 * np.pi, num_zones, endpoint=False).tolist()
-        values += values[:1]  # Close the plot
-        angles += angles[:1]
+        ax.set_thetagrids(self.theta_degrees, self.zone_labels, fontsize=10)
+        
+        ax.grid(True)
         
-        # Plot the radar chart
-        ax.plot(angles, values, 'o-', linewidth=2, label=player_name, color=color)
-        ax.fill(angles, values, alpha=0.25, color=color)
+        return fig, ax
+    
+    def render_into(self,
+                    fig: plt.Figure,
+                    ax: plt.Axes,
+                    zone_data: Dict[str, float],
+                    player_name: str = "Player",
+                    title: Optional[str] = None,
+                    color: str = '#1f77b4',
+                    save_path: Optional[str] = None,
+                    use_made_shots: bool = False,
+                    data_type_name: str = "Made Shots",
+                    close_after_save: bool = False) -> Optional[plt.Figure]:
+        """Draw one player into a figure from prepare_template, replacing any previous player."""
+        
+        # Drop the previous player's ring, fill and value labels; static styling stays
+        for artist in [*ax.lines, *ax.patches, *ax.texts]:
+            artist.remove()
         
-        # Customize the chart based on data type
-        ax.set_xticks(angles[:-1])
-        ax.set_xticklabels(labels, fontsize=10)
+        labels, values = self.prepare_data_for_radar(zone_data)
+        values = self.close_ring(values)  # Close the plot
+        angles = self.closed_angles
+        
+        # Plot the radar chart (data layer rasterized; axes and labels stay vector)
+        ax.plot(angles, values, 'o-', linewidth=2, label=player_name, color=color, rasterized=True)
+        ax.fill(angles, values, alpha=0.25, color=color, rasterized=True)
+        
+        # Only non-zero zones get a value label
+        labeled = values[:-1] > 0
+        label_angles = self.angles[labeled]
+        label_values = values[:-1][labeled]
         
         if use_made_shots:
             # Set up for count data (made shots or attempts)
-            max_value = max(values[:-1]) if values[:-1] else 10
+            max_value = values[:-1].max()
             max_scale = max(10, int(max_value * 1.2))  # 20% buffer above max
             ax.set_ylim(0, max_scale)
             
@@ -84,38 +138,40 @@ class RadarChartPlotter:
             ax.set_yticklabels([str(tick) for tick in ticks], fontsize=8)
             
             # Add value labels on the chart
-            for angle, value, label in zip(angles[:-1], values[:-1], labels):
-                if value > 0:
-                    ax.text(angle, value + max_scale * 0.05, f'{int(value)}', 
-                           horizontalalignment='center', fontsize=8, fontweight='bold')
+            for angle, value in zip(label_angles, label_values):
+                ax.text(angle, value + max_scale * 0.05, f'{int(value)}', 
+                       horizontalalignment='center', fontsize=8, fontweight='bold')
         else:
-            # Set up for percentages
+            # Set up for percentages; set on every render since a count render changes the scale
             ax.set_ylim(0, 100)
             ax.set_yticks([20, 40, 60, 80, 100])
             ax.set_yticklabels(['20%', '40%', '60%', '80%', '100%'], fontsize=8)
             
             # Add percentage labels on the chart
-            for angle, value, label in zip(angles[:-1], values[:-1], labels):
-                if value > 0:
-                    ax.text(angle, value + 5, f'{value:.0f}%', 
-                           horizontalalignment='center', fontsize=8, fontweight='bold')
-        
-        ax.grid(True)
+            for angle, value in zip(label_angles, label_values):
+                ax.text(angle, value + 5, f'{value:.0f}%', 
+                       horizontalalignment='center', fontsize=8, fontweight='bold')
         
         # Add title
         if use_made_shots:
             plot_title = title or f"{player_name} - {data_type_name}"
         else:
             plot_title = title or f"{player_name} - Shot Chart Analysis"
-        plt.title(plot_title, size=16, fontweight='bold', pad=30)
+        ax.set_title(plot_title, size=16, fontweight='bold', pad=30)
         
         # Add legend
-        plt.legend(loc='upper right', bbox_to_anchor=(1.2, 1.0))
+        ax.legend(loc='upper right', bbox_to_anchor=(1.2, 1.0))
         
-        plt.tight_layout()
+        # Start from the default margins so a reused template lays out like a fresh figure
+        fig.subplots_adjust(**{side: plt.rcParams[f'figure.subplot.{side}']
+                               for side in ('left', 'right', 'bottom', 'top')})
+        fig.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            fig.savefig(save_path, dpi=300, bbox_inches='tight')
+            if close_after_save:
+                plt.close(fig)  # Release the figure from pyplot's registry
+                return None
         
         return fig
     
@@ -124,38 +180,37 @@ class RadarChartPlotter:
                              title: str = "Player Comparison",
                              save_path: Optional[str] = None,
                              use_made_shots: bool = False,
-                             data_type_name: str = "Made Shots") -> plt.Figure:
-        """Create a radar chart comparing multiple players."""
+                             data_type_name: str = "Made Shots",
+                             close_after_save: bool = False) -> Optional[plt.Figure]:
+        """Create a radar chart comparing multiple players.
+        
+        Batch callers that only need the saved file should pass close_after_save=True,
+        which closes the figure after saving and returns None.
+        """
         
         fig, ax = plt.subplots(figsize=(12, 10), subplot_kw=dict(projection='polar'))
         
         player_names = list(player_data.keys())
-        all_values = []
+        labels, values_mat = self.prepare_matrix_for_radar(player_data)
+        closed_values = self.close_ring(values_mat)  # Close the plot
+        angles = self.closed_angles
         
-        for i, (player_name, zone_data) in enumerate(player_data.items()):
-            labels, values = self.prepare_data_for_radar(zone_data)
-            all_values.extend(values)
-            
-            # Set up angles
-            num_zones = len(values)
-            angles = np.linspace(0, 2 * np.pi, num_zones, endpoint=False).tolist()
-            values += values[:1]  # Close the plot
-            angles += angles[:1]
-            
-            # Get color for this player
-            color = self.colors[i % len(self.colors)]
-            
-            # Plot the radar chart
-            ax.plot(angles, values, 'o-', linewidth=2, label=player_name, color=color)
-            ax.fill(angles, values, alpha=0.15, color=color)
+        player_colors = [self.colors[i % len(self.colors)] for i in range(len(player_names))]
+        for player_name, values, color in zip(player_names, closed_values, player_colors):
+            # Plot the radar chart (data layer rasterized; axes and labels stay vector)
+            ax.plot(angles, values, 'o-', linewidth=2, label=player_name, color=color, rasterized=True)
+        
+        # Fill every player's area with a single collection instead of one patch per player
+        verts = np.stack([np.broadcast_to(angles, closed_values.shape), closed_values], axis=-1)
+        ax.add_collection(PolyCollection(verts, facecolors=player_colors, edgecolors=player_colors,
+                                         alpha=0.15, rasterized=True))
         
         # Customize the chart based on data type
-        ax.set_xticks(angles[:-1])
-        ax.set_xticklabels(labels, fontsize=10)
+        ax.set_thetagrids(self.theta_degrees, self.zone_labels, fontsize=10)
         
         if use_made_shots:
             # Set up for count data (made shots or attempts)
-            max_value = max(all_values) if all_values else 10
+            max_value = values_mat.max() if values_mat.size else 10
             max_scale = max(10, int(max_value * 1.2))  # 20% buffer above max
             ax.set_ylim(0, max_scale)
             
@@ -177,15 +232,18 @@ class RadarChartPlotter:
             plot_title = title if "Comparison" in title else f"{data_type_name} Comparison"
         else:
             plot_title = title if "Comparison" in title else "Player Comparison"
-        plt.title(plot_title, size=16, fontweight='bold', pad=30)
+        ax.set_title(plot_title, size=16, fontweight='bold', pad=30)
         
         # Add legend
-        plt.legend(loc='upper right', bbox_to_anchor=(1.3, 1.0))
+        ax.legend(loc='upper right', bbox_to_anchor=(1.3, 1.0))
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            fig.savefig(save_path, dpi=300, bbox_inches='tight')
+            if close_after_save:
+                plt.close(fig)  # Release the figure from pyplot's registry
+                return None
         
         return fig
     
@@ -202,32 +260,26 @@ class RadarChartPlotter:
         ax1 = fig.add_subplot(121, projection='polar')
         
         player_names = list(player_data.keys())
-        all_values = []
+        labels, values_mat = self.prepare_matrix_for_radar(player_data)
+        closed_values = self.close_ring(values_mat)  # Close the plot
+        angles = self.closed_angles
         
-        for i, (player_name, zone_data) in enumerate(player_data.items()):
-            labels, values = self.prepare_data_for_radar(zone_data)
-            all_values.extend(values)
-            
-            # Set up angles
-            num_zones = len(values)
-            angles = np.linspace(0, 2 * np.pi, num_zones, endpoint=False).tolist()
-            values += values[:1]  # Close the plot
-            angles += angles[:1]
-            
-            # Get color for this player
-            color = self.colors[i % len(self.colors)]
-            
-            # Plot the radar chart
-            ax1.plot(angles, values, 'o-', linewidth=2, label=player_name, color=color)
-            ax1.fill(angles, values, alpha=0.15, color=color)
+        player_colors = [self.colors[i % len(self.colors)] for i in range(len(player_names))]
+        for player_name, values, color in zip(player_names, closed_values, player_colors):
+            # Plot the radar chart (data layer rasterized; axes and labels stay vector)
+            ax1.plot(angles, values, 'o-', linewidth=2, label=player_name, color=color, rasterized=True)
+        
+        # Fill every player's area with a single collection instead of one patch per player
+        verts = np.stack([np.broadcast_to(angles, closed_values.shape), closed_values], axis=-1)
+        ax1.add_collection(PolyCollection(verts, facecolors=player_colors, edgecolors=player_colors,
+                                         alpha=0.15, rasterized=True))
         
         # Customize radar chart based on data type
-        ax1.set_xticks(angles[:-1])
-        ax1.set_xticklabels(labels, fontsize=9)
+        ax1.set_thetagrids(self.theta_degrees, self.zone_labels, fontsize=9)
         
         if use_made_shots:
             # Set up for count data (made shots or attempts)
-            max_value = max(all_values) if all_values else 10
+            max_value = values_mat.max() if values_mat.size else 10
             max_scale = max(10, int(max_value * 1.2))  # 20% buffer above max
             ax1.set_ylim(0, max_scale)
             
@@ -253,19 +305,19 @@ class RadarChartPlotter:
         x_pos = np.arange(len(zones))
         width = 0.35
         
-        for i, (player_name, zone_data) in enumerate(player_data.items()):
-            values = [zone_data.get(zone, 0.0) for zone in zones]
-            color = self.colors[i % len(self.colors)]
-            
-            offset = (i - len(player_names)/2 + 0.5) * width
-            ax2.bar(x_pos + offset, values, width, label=player_name, color=color, alpha=0.8)
+        # Draw every player's bars in one call, reusing the radar matrix (rows are players)
+        n_players = len(player_names)
+        offsets = (np.arange(n_players) - n_players / 2 + 0.5) * width
+        bar_colors = [self.colors[i % len(self.colors)] for i in range(n_players) for _ in zones]
+        bars = ax2.bar((x_pos[None, :] + offsets[:, None]).ravel(), values_mat.ravel(), width,
+                       color=bar_colors, alpha=0.8, rasterized=True)
         
         ax2.set_xlabel('Shot Zones', fontweight='bold')
         
         if use_made_shots:
             ax2.set_ylabel(f'{data_type_name} Count', fontweight='bold')
             ax2.set_title(f'Bar Chart Comparison ({data_type_name})', fontsize=14, fontweight='bold')
-            max_bar_value = max([max(zone_data.values()) for zone_data in player_data.values()]) if player_data else 10
+            max_bar_value = float(values_mat.max()) if values_mat.size else 10
             ax2.set_ylim(0, max_bar_value * 1.1)
         else:
             ax2.set_ylabel('Shooting Percentage (%)', fontweight='bold')
@@ -273,16 +325,17 @@ class RadarChartPlotter:
             ax2.set_ylim(0, 100)
         
         ax2.set_xticks(x_pos)
-        ax2.set_xticklabels([zone.replace(' ', '\n') for zone in zones], rotation=45, ha='right')
-        ax2.legend()
+        ax2.set_xticklabels(self.zone_labels, rotation=45, ha='right')
+        # One legend entry per player, using the first bar of each row
+        ax2.legend(bars.patches[::len(zones)], player_names)
         ax2.grid(axis='y', alpha=0.3)
         
         if use_made_shots:
             main_title = f"{title} - {data_type_name}"
         else:
             main_title = f"{title} - Shooting Percentages"
-        plt.suptitle(main_title, fontsize=16, fontweight='bold')
-        plt.tight_layout()
+        fig.suptitle(main_title, fontsize=16, fontweight='bold')
+        fig.tight_layout()
         
         return fig
 
@@ -307,7 +360,9 @@ if __name__ == "__main__":
     
     # Test single player radar
     fig1 = plotter.plot_single_player_radar(sample_data, "Test Player")
-    plt.show()
+    if not HEADLESS:
+        plt.show()
+    plt.close(fig1)
     
     # Test comparison radar
     comparison_data = {
@@ -316,4 +371,6 @@ if __name__ == "__main__":
     }
     
     fig2 = plotter.plot_comparison_radar(comparison_data)
-    plt.show() 
\ No newline at end of file
+    if not HEADLESS:
+        plt.show()
+    plt.close(fig2)
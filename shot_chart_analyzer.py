@@ -1,10 +1,17 @@
+from collections import defaultdict
+from functools import lru_cache
 from typing import List, Dict, Tuple
-from ocr_extractor import ShotChartOCR
+from ocr_extractor import get_shared_ocr
+import numpy as np
 import json
+import os
 
 class ShotChartAnalyzer:
     """Complete shot chart analyzer with OCR detection and proper zone mapping."""
     
+    # Number of analyzed charts remembered per analyzer
+    REPORT_CACHE_SIZE = 32
+    
     def __init__(self):
         # Basketball court zones based on actual position analysis
         self.zones = {
@@ -55,23 +62,53 @@ class ShotChartAnalyzer:
                 'description': 'Right side mid-range area'
             }
         }
+        
+        # Zone boxes as (x0, x1, y0, y1) rows for vectorized lookups; row order is match priority
+        self.zone_names = list(self.zones.keys())
+        self.zone_bounds = np.array([zone['x_range'] + zone['y_range'] for zone in self.zones.values()])
+        
+        # OCR extractor, created on first analysis and reused afterwards
+        self._ocr = None
+        
+        # Reports keyed by (image_path, mtime) so an edited file is re-analyzed
+        self._analyze_cached = lru_cache(maxsize=self.REPORT_CACHE_SIZE)(self._analyze)
     
     def map_stat_to_zone(self, stat: Dict) -> str:
         """Map a detected statistic to its basketball court zone."""
         x, y = stat['center_x'], stat['center_y']
+        bounds = self.zone_bounds
         
-        for zone_name, zone_def in self.zones.items():
-            if (zone_def['x_range'][0] <= x <= zone_def['x_range'][1] and
-                zone_def['y_range'][0] <= y <= zone_def['y_range'][1]):
-                return zone_name
+        inside = (bounds[:, 0] <= x) & (x <= bounds[:, 1]) & (bounds[:, 2] <= y) & (y <= bounds[:, 3])
+        first = int(inside.argmax())
         
-        return 'Unknown Zone'
+        return self.zone_names[first] if inside[first] else 'Unknown Zone'
+    
+    def map_stats_batch(self, stats: List[Dict]) -> List[str]:
+        """Map many detected statistics to their zones in one vectorized pass."""
+        xs = np.array([stat['center_x'] for stat in stats])[:, None]
+        ys = np.array([stat['center_y'] for stat in stats])[:, None]
+        bounds = self.zone_bounds
+        
+        # (stats, zones) membership; the first matching zone wins, as in map_stat_to_zone
+        inside = (bounds[:, 0] <= xs) & (xs <= bounds[:, 1]) & (bounds[:, 2] <= ys) & (ys <= bounds[:, 3])
+        first = inside.argmax(axis=1)
+        
+        return [self.zone_names[z] if hit else 'Unknown Zone'
+                for z, hit in zip(first.tolist(), inside.any(axis=1).tolist())]
     
     def analyze_shot_chart(self, image_path: str) -> Dict:
-        """Analyze a shot chart and return properly mapped basketball statistics."""
+        """Analyze a shot chart and return properly mapped basketball statistics.
+        
+        Reports are cached per file modification time; treat the returned dict as read-only.
+        """
+        return self._analyze_cached(image_path, os.path.getmtime(image_path))
+    
+    def _analyze(self, image_path: str, mtime: float) -> Dict:
+        """Run OCR and zone mapping for one chart (mtime only keys the cache)."""
         # Get OCR results
-        ocr = ShotChartOCR()
-        raw_stats = ocr.extract_basketball_stats(image_path)
+        if self._ocr is None:
+            self._ocr = get_shared_ocr()
+        raw_stats = self._ocr.extract_basketball_stats(image_path)
         
         # Filter out inferred N/A values for zone mapping
         actual_stats = [s for s in raw_stats if s.get('method') != 'inferred_na']
@@ -85,31 +122,34 @@ class ShotChartAnalyzer:
                 'detected_stats': []
             }
         
-        # Map each stat to its zone
-        for stat in actual_stats:
-            zone = self.map_stat_to_zone(stat)
-            if zone != 'Unknown Zone':
-                zone_data[zone]['detected_stats'].append(stat)
-        
-        # Process each zone to extract shots and percentages
-        for zone_name, data in zone_data.items():
-            stats = data['detected_stats']
-            if stats:
-                # Find shots (contains '/') and percentages (contains '%')
-                shots = [s for s in stats if '/' in s['text']]
-                percentages = [s for s in stats if '%' in s['text']]
-                
-                if zone_name == 'Free Throw Line' and len(shots) == 2:
-                    # Special handling for Free Throw Line - combine left and right
-                    # Find left side (lower x) and right side (higher x)
-                    left_shot = min(shots, key=lambda s: s['center_x'])
-                    right_shot = max(shots, key=lambda s: s['center_x'])
-                    data['shots_made_attempted'] = f"{left_shot['text']} + {right_shot['text']}"
-                elif shots:
-                    data['shots_made_attempted'] = shots[0]['text']
-                    
-                if percentages:
-                    data['percentage'] = percentages[0]['text']
+        # Map and classify every stat in one pass: shots ('/'), percentages ('%') or other
+        zone_shots = defaultdict(list)
+        zone_percentages = defaultdict(list)
+        for stat, zone in zip(actual_stats, self.map_stats_batch(actual_stats)):
+            text = stat['text']
+            kind = 'shots' if '/' in text else 'pct' if '%' in text else 'other'
+            stat['zone'] = zone
+            if zone == 'Unknown Zone':
+                continue
+            zone_data[zone]['detected_stats'].append(stat)
+            if kind == 'shots':
+                zone_shots[zone].append(stat)
+            elif kind == 'pct':
+                zone_percentages[zone].append(stat)
+        
+        # Fill in shots for zones that received any
+        for zone_name, shots in zone_shots.items():
+            if zone_name == 'Free Throw Line' and len(shots) == 2:
+                # Special handling for Free Throw Line - combine left and right
+                # Find left side (lower x) and right side (higher x)
+                left_shot = min(shots, key=lambda s: s['center_x'])
+                right_shot = max(shots, key=lambda s: s['center_x'])
+                zone_data[zone_name]['shots_made_attempted'] = f"{left_shot['text']} + {right_shot['text']}"
+            else:
+                zone_data[zone_name]['shots_made_attempted'] = shots[0]['text']
+        
+        for zone_name, percentages in zone_percentages.items():
+            zone_data[zone_name]['percentage'] = percentages[0]['text']
         
         # Create final report
         player_name = image_path.split('/')[-1].replace('.jpeg', '').replace('_', ' ').title()
@@ -159,8 +199,7 @@ class ShotChartAnalyzer:
         
         print(f"\nDetailed positions:")
         for detection in report['raw_detections']:
-            zone = self.map_stat_to_zone(detection)
-            print(f"  '{detection['text']}' at ({detection['center_x']}, {detection['center_y']}) -> {zone}")
+            print(f"  '{detection['text']}' at ({detection['center_x']}, {detection['center_y']}) -> {detection['zone']}")
 
 def test_analyzer():
     """Test the shot chart analyzer."""
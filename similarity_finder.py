@@ -1,9 +1,29 @@
 import numpy as np
-from typing import Dict, List, Tuple, Optional
-from sklearn.metrics.pairwise import cosine_similarity
-from sklearn.preprocessing import StandardScaler
+from typing import Dict, Iterable, List, NamedTuple, Tuple, Optional, Union
+import atexit
 import json
+import math
 import os
+import weakref
+
+try:
+    import orjson
+except ImportError:  # Fall back to the standard json module
+    orjson = None
+
+
+def _flush_at_exit(database_ref: weakref.ref):
+    """Flush a PlayerDatabase at interpreter exit if it is still alive."""
+    database = database_ref()
+    if database is not None:
+        database.flush()
+
+
+class PlayerMatrix(NamedTuple):
+    """Players prepared for similarity queries: one zone vector per row, its norm and name."""
+    matrix: np.ndarray
+    norms: np.ndarray
+    names: List[str]
 
 
 class PlayerSimilarityFinder:
@@ -15,156 +35,191 @@ class PlayerSimilarityFinder:
             'Left Corner 3', 'Left Wing 3', 'Top of Key 3', 'Right Wing 3', 'Right Corner 3',
             'Left Mid Range', 'Left Free Throw', 'Right Free Throw', 'Right Mid Range', 'Paint'
         ]
+        self.three_point_zones = self.standard_zones[:5]
     
-    def normalize_player_data(self, player_data: Dict[str, Dict[str, float]]) -> Dict[str, List[float]]:
-        """Normalize player data to consistent format for comparison."""
-        normalized_data = {}
+    def normalize_player_data(self, player_data: Dict[str, Dict[str, float]]) -> Tuple[np.ndarray, List[str]]:
+        """Normalize player data to a (players, zones) matrix for comparison.
         
-        for player_name, zone_percentages in player_data.items():
-            # Create vector with all standard zones
-            player_vector = []
-            for zone in self.standard_zones:
-                percentage = zone_percentages.get(zone, 0.0)
-                player_vector.append(percentage)
-            
-            normalized_data[player_name] = player_vector
+        Rows follow the returned player names; columns follow standard_zones.
+        """
+        player_names = list(player_data.keys())
+        zone_dicts = list(player_data.values())
+        n_players = len(player_names)
+        
+        # Fill one zone column at a time
+        matrix = np.zeros((n_players, len(self.standard_zones)), dtype=np.float32)
+        for z, zone in enumerate(self.standard_zones):
+            matrix[:, z] = np.fromiter((zone_percentages.get(zone, 0.0) for zone_percentages in zone_dicts),
+                                       dtype=np.float32, count=n_players)
+        
+        return matrix, player_names
+    
+    def prepare_player_matrix(self, player_data: Union[Dict[str, Dict[str, float]], 'PlayerDatabase', PlayerMatrix]
+                              ) -> PlayerMatrix:
+        """Get the (players, zones) matrix, row norms and player names for a query.
+        
+        A PlayerMatrix from precompute() is used as is, a PlayerDatabase serves its cached
+        vectors, and plain dicts are normalized on the spot.
+        """
+        if isinstance(player_data, PlayerMatrix):
+            return player_data
+        if isinstance(player_data, PlayerDatabase):
+            return PlayerMatrix(*player_data.get_player_vectors(self.standard_zones))
+        
+        player_matrix, player_names = self.normalize_player_data(player_data)
+        norms = np.sqrt(np.einsum('ij,ij->i', player_matrix, player_matrix))
+        return PlayerMatrix(player_matrix, norms, player_names)
+    
+    def precompute(self, player_data: Dict[str, Dict[str, float]]) -> PlayerMatrix:
+        """Normalize player data once for several queries.
         
-        return normalized_data
+        Pass the result in place of player_data to the find/similarity methods; build a new
+        one after the underlying data changes.
+        """
+        return self.prepare_player_matrix(player_data)
     
-    def compute_cosine_similarity(self, vector1: List[float], vector2: List[float]) -> float:
-        """Compute cosine similarity between two player vectors."""
+    def compute_cosine_similarity(self, vector1: List[float], vector2: List[float],
+                                  norm1: Optional[float] = None, norm2: Optional[float] = None) -> float:
+        """Compute cosine similarity between two player vectors.
+        
+        Pass precomputed vector norms when comparing the same vectors repeatedly.
+        """
         # Convert to numpy arrays
-        v1 = np.array(vector1).reshape(1, -1)
-        v2 = np.array(vector2).reshape(1, -1)
+        v1 = np.asarray(vector1, dtype=np.float32)
+        v2 = np.asarray(vector2, dtype=np.float32)
+        
+        if norm1 is None:
+            norm1 = math.sqrt(np.vdot(v1, v1))
+        if norm2 is None:
+            norm2 = math.sqrt(np.vdot(v2, v2))
         
         # Handle zero vectors
-        if np.all(v1 == 0) or np.all(v2 == 0):
+        if norm1 == 0 or norm2 == 0:
             return 0.0
         
         # Compute cosine similarity
-        similarity = cosine_similarity(v1, v2)[0][0]
-        return similarity
+        return float(np.dot(v1, v2) / (norm1 * norm2))
     
     def compute_euclidean_distance(self, vector1: List[float], vector2: List[float]) -> float:
         """Compute normalized Euclidean distance between two player vectors."""
-        v1 = np.array(vector1)
-        v2 = np.array(vector2)
+        v1 = np.asarray(vector1, dtype=np.float32)
+        v2 = np.asarray(vector2, dtype=np.float32)
         
         # Compute Euclidean distance
         distance = np.linalg.norm(v1 - v2)
         
         # Normalize by maximum possible distance (considering percentages 0-100)
-        max_distance = np.sqrt(len(vector1) * (100 ** 2))
+        max_distance = math.sqrt(len(vector1) * (100 ** 2))
         normalized_distance = distance / max_distance
         
         # Convert to similarity (1 - distance)
         similarity = 1 - normalized_distance
-        return max(0, similarity)
+        return float(max(0, similarity))
+    
+    def compute_similarity_vector(self, player_matrix: np.ndarray, target_index: int,
+                                  method: str = 'cosine',
+                                  norms: Optional[np.ndarray] = None) -> np.ndarray:
+        """Compute the similarity of every player row to the target row in one pass."""
+        target_vector = player_matrix[target_index]
+        
+        if method == 'cosine':
+            # Zero vectors score 0, as in compute_cosine_similarity
+            if norms is None:
+                norms = np.sqrt(np.einsum('ij,ij->i', player_matrix, player_matrix))
+            norms = np.where(norms == 0, 1, norms)
+            target_norm = norms[target_index]
+            return (player_matrix @ target_vector) / (norms * target_norm)
+        elif method == 'euclidean':
+            distances = np.linalg.norm(player_matrix - target_vector, axis=1)
+            max_distance = math.sqrt(len(self.standard_zones) * (100 ** 2))  # Python float keeps float32
+            return np.maximum(0, 1 - distances / max_distance)
+        else:
+            raise ValueError(f"Unknown similarity method: {method}")
     
     def find_most_similar_player(self, 
                                 target_player: str,
-                                player_data: Dict[str, Dict[str, float]],
+                                player_data: Union[Dict[str, Dict[str, float]], 'PlayerDatabase', PlayerMatrix],
                                 method: str = 'cosine',
                                 exclude_self: bool = True) -> Tuple[str, float]:
         """Find the most similar player to the target player."""
         
-        if target_player not in player_data:
-            raise ValueError(f"Target player '{target_player}' not found in player data")
-        
         # Normalize all player data
-        normalized_data = self.normalize_player_data(player_data)
-        target_vector = normalized_data[target_player]
-        
-        similarities = []
+        player_matrix, norms, player_names = self.prepare_player_matrix(player_data)
         
-        for player_name, player_vector in normalized_data.items():
-            # Skip self if requested
-            if exclude_self and player_name == target_player:
-                continue
-            
-            # Compute similarity based on method
-            if method == 'cosine':
-                similarity = self.compute_cosine_similarity(target_vector, player_vector)
-            elif method == 'euclidean':
-                similarity = self.compute_euclidean_distance(target_vector, player_vector)
-            else:
-                raise ValueError(f"Unknown similarity method: {method}")
-            
-            similarities.append((player_name, similarity))
+        if target_player not in player_names:
+            raise ValueError(f"Target player '{target_player}' not found in player data")
         
-        # Sort by similarity (highest first)
-        similarities.sort(key=lambda x: x[1], reverse=True)
+        target_index = player_names.index(target_player)
+        similarities = self.compute_similarity_vector(player_matrix, target_index, method, norms)
         
-        if not similarities:
-            return "No similar players found", 0.0
+        # Skip self if requested
+        if exclude_self:
+            if len(player_names) == 1:
+                return "No similar players found", 0.0
+            similarities[target_index] = -np.inf
         
-        return similarities[0]
+        # First highest score wins, as with the previous stable sort
+        best = int(np.argmax(similarities))
+        return player_names[best], float(similarities[best])
     
     def find_top_similar_players(self, 
                                 target_player: str,
-                                player_data: Dict[str, Dict[str, float]],
+                                player_data: Union[Dict[str, Dict[str, float]], 'PlayerDatabase', PlayerMatrix],
                                 top_n: int = 5,
                                 method: str = 'cosine',
                                 exclude_self: bool = True) -> List[Tuple[str, float]]:
         """Find the top N most similar players to the target player."""
         
-        if target_player not in player_data:
+        # Normalize all player data and score everyone against the target at once
+        player_matrix, norms, player_names = self.prepare_player_matrix(player_data)
+        
+        if target_player not in player_names:
             raise ValueError(f"Target player '{target_player}' not found in player data")
         
-        # Normalize all player data
-        normalized_data = self.normalize_player_data(player_data)
-        target_vector = normalized_data[target_player]
+        target_index = player_names.index(target_player)
+        similarities = self.compute_similarity_vector(player_matrix, target_index, method, norms)
         
-        similarities = []
+        # Skip self if requested
+        candidates = np.arange(len(player_names))
+        if exclude_self:
+            candidates = np.delete(candidates, target_index)
+        candidate_scores = similarities[candidates]
         
-        for player_name, player_vector in normalized_data.items():
-            # Skip self if requested
-            if exclude_self and player_name == target_player:
-                continue
-            
-            # Compute similarity based on method
-            if method == 'cosine':
-                similarity = self.compute_cosine_similarity(target_vector, player_vector)
-            elif method == 'euclidean':
-                similarity = self.compute_euclidean_distance(target_vector, player_vector)
-            else:
-                raise ValueError(f"Unknown similarity method: {method}")
-            
-            similarities.append((player_name, similarity))
+        # Highest first; ties keep player order. Partition first when only a few are needed
+        order = np.arange(len(candidates))
+        if 0 < top_n < len(candidates):
+            cutoff = -np.partition(-candidate_scores, top_n - 1)[top_n - 1]
+            order = np.flatnonzero(candidate_scores >= cutoff)
+        order = order[np.argsort(-candidate_scores[order], kind='stable')][:top_n]
         
-        # Sort by similarity (highest first) and return top N
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        return similarities[:top_n]
+        return [(player_names[candidates[i]], float(candidate_scores[i])) for i in order]
     
     def create_similarity_matrix(self, 
-                                player_data: Dict[str, Dict[str, float]],
+                                player_data: Union[Dict[str, Dict[str, float]], 'PlayerDatabase', PlayerMatrix],
                                 method: str = 'cosine') -> Tuple[np.ndarray, List[str]]:
         """Create a similarity matrix for all players."""
         
         # Normalize all player data
-        normalized_data = self.normalize_player_data(player_data)
-        player_names = list(normalized_data.keys())
-        
-        # Create matrix
-        n_players = len(player_names)
-        similarity_matrix = np.zeros((n_players, n_players))
-        
-        for i, player1 in enumerate(player_names):
-            for j, player2 in enumerate(player_names):
-                if i == j:
-                    similarity_matrix[i][j] = 1.0  # Self-similarity
-                else:
-                    vector1 = normalized_data[player1]
-                    vector2 = normalized_data[player2]
-                    
-                    if method == 'cosine':
-                        similarity = self.compute_cosine_similarity(vector1, vector2)
-                    elif method == 'euclidean':
-                        similarity = self.compute_euclidean_distance(vector1, vector2)
-                    else:
-                        raise ValueError(f"Unknown similarity method: {method}")
-                    
-                    similarity_matrix[i][j] = similarity
+        player_matrix, norms, player_names = self.prepare_player_matrix(player_data)
+        
+        if method == 'cosine':
+            # Scale rows to unit length (zero rows stay zero) so one product gives every pair
+            unit_matrix = player_matrix / np.where(norms == 0, 1, norms)[:, None]
+            similarity_matrix = unit_matrix @ unit_matrix.T
+        elif method == 'euclidean':
+            # Pairwise distances from ||a-b||^2 = ||a||^2 + ||b||^2 - 2a.b, sharing one Gram product.
+            # Accumulate in float64: the subtraction cancels badly in float32 for near-identical players
+            matrix64 = player_matrix.astype(np.float64)
+            squared_norms = np.einsum('ij,ij->i', matrix64, matrix64)
+            squared_distances = squared_norms[:, None] + squared_norms[None, :] - 2 * (matrix64 @ matrix64.T)
+            np.maximum(squared_distances, 0, out=squared_distances)
+            distances = np.sqrt(squared_distances).astype(np.float32)
+            max_distance = math.sqrt(len(self.standard_zones) * (100 ** 2))  # Python float keeps float32
+            similarity_matrix = np.maximum(0, 1 - distances / max_distance)
+        else:
+            raise ValueError(f"Unknown similarity method: {method}")
+        
+        np.fill_diagonal(similarity_matrix, 1.0)  # Self-similarity
         
         return similarity_matrix, player_names
     
@@ -182,31 +237,32 @@ class PlayerSimilarityFinder:
             'well_rounded': False
         }
         
+        # One array of every zone's percentage, in the player's zone order
+        zones = list(player_data.keys())
+        values = np.fromiter(player_data.values(), dtype=np.float64, count=len(zones))
+        
         # Get all non-zero percentages
-        percentages = [v for v in player_data.values() if v > 0]
+        made = values > 0
+        percentages = values[made]
         
-        if not percentages:
+        if not percentages.size:
             return analysis
         
-        overall_avg = np.mean(percentages)
+        overall_avg = percentages.mean()
         analysis['overall_average'] = overall_avg
         
         # Calculate consistency (lower standard deviation = more consistent)
-        if len(percentages) > 1:
-            std_dev = np.std(percentages)
+        if percentages.size > 1:
+            std_dev = percentages.std()
             # Normalize consistency score (higher = more consistent)
             analysis['consistency'] = max(0, 100 - std_dev)
         
         # Identify strengths and weaknesses
-        for zone, percentage in player_data.items():
-            if percentage > overall_avg + 10:
-                analysis['strengths'].append(zone)
-            elif percentage > 0 and percentage < overall_avg - 10:
-                analysis['weaknesses'].append(zone)
+        analysis['strengths'] = [zones[i] for i in np.flatnonzero(values > overall_avg + 10)]
+        analysis['weaknesses'] = [zones[i] for i in np.flatnonzero(made & (values < overall_avg - 10))]
         
         # Identify playing style
-        three_point_zones = ['Left Corner 3', 'Left Wing 3', 'Top of Key 3', 'Right Wing 3', 'Right Corner 3']
-        three_point_avg = np.mean([player_data.get(zone, 0) for zone in three_point_zones])
+        three_point_avg = np.mean([player_data.get(zone, 0) for zone in self.three_point_zones])
         
         paint_percentage = player_data.get('Paint', 0)
         
@@ -223,41 +279,88 @@ class PlayerDatabase:
     def __init__(self, db_file: str = "player_database.json"):
         self.db_file = db_file
         self.data = self.load_database()
+        
+        # Zone order of the percentage matrix below
+        self.standard_zones = [
+            'Left Corner 3', 'Left Wing 3', 'Top of Key 3', 'Right Wing 3', 'Right Corner 3',
+            'Left Mid Range', 'Left Free Throw', 'Right Free Throw', 'Right Mid Range', 'Paint'
+        ]
+        
+        # Percentages kept alongside self.data as one row per player (in self.data order);
+        # rows past the player count are spare capacity
+        self._percentages = np.zeros((0, len(self.standard_zones)), dtype=np.float32)
+        self._norms = np.zeros(0, dtype=np.float32)
+        self._names = []
+        self._name_to_idx = {}
+        for player_name, percentages in self.get_all_players().items():
+            self._store_vector(player_name, percentages)
+        
+        # Changes are written in one go by flush(), at the latest when the database is
+        # collected (__del__) or the program exits; the exit hook holds only a weak
+        # reference so dropped databases can still be collected
+        self._dirty = False
+        atexit.register(_flush_at_exit, weakref.ref(self))
     
     def load_database(self) -> Dict[str, Dict[str, any]]:
         """Load player data from JSON file."""
         if os.path.exists(self.db_file):
             try:
-                with open(self.db_file, 'r') as f:
-                    data = json.load(f)
-                    # Convert old format to new format if needed
-                    for player_name, player_data in data.items():
-                        if 'percentages' not in player_data:
-                            # Old format: convert to new format
-                            data[player_name] = {
-                                'percentages': player_data,
-                                'made_shots': {},
-                                'attempts': {}
-                            }
-                    return data
+                # One read, then parse the bytes directly (orjson's decode error subclasses json's)
+                with open(self.db_file, 'rb') as f:
+                    raw = f.read()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                
+                # Convert old format to new format if needed
+                return {
+                    player_name: player_data if 'percentages' in player_data else {
+                        'percentages': player_data,
+                        'made_shots': {},
+                        'attempts': {}
+                    }
+                    for player_name, player_data in data.items()
+                }
             except (json.JSONDecodeError, IOError):
                 return {}
         return {}
     
-    def save_database(self):
+    def save_database(self) -> bool:
         """Save player data to JSON file."""
         try:
-            with open(self.db_file, 'w') as f:
-                json.dump(self.data, f, indent=2)
-        except IOError:
+            # Serialize fully before touching the file, so a bad value never truncates it
+            if orjson is not None:
+                payload = orjson.dumps(self.data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+            else:
+                payload = json.dumps(self.data, indent=2).encode('utf-8')
+            
+            # Write a sibling temp file and swap it in, so readers never see a partial database
+            tmp_file = f"{self.db_file}.tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_file, self.db_file)
+            return True
+        except (IOError, TypeError):  # TypeError covers unserializable values (incl. orjson.JSONEncodeError)
             print(f"Warning: Could not save database to {self.db_file}")
+            return False
+    
+    def flush(self):
+        """Write pending player changes to the JSON file."""
+        if self._dirty and self.save_database():
+            self._dirty = False
+    
+    def __del__(self):
+        # Save pending changes of a database that is dropped before the program exits
+        if getattr(self, '_dirty', False):
+            self.flush()
     
     def add_player(self, player_name: str, percentages: Dict[str, float], 
                    made_shots: Optional[Dict[str, int]] = None, 
                    attempts: Optional[Dict[str, int]] = None,
                    games_played: int = 44,
                    original_games: Optional[int] = None):
-        """Add a player to the database with percentages, made shots, attempts, and games played."""
+        """Add a player to the database with percentages, made shots, attempts, and games played.
+        
+        The change is saved on the next flush() (or at exit).
+        """
         self.data[player_name] = {
             'percentages': percentages,
             'made_shots': made_shots or {},
@@ -265,7 +368,14 @@ class PlayerDatabase:
             'games_played': games_played,
             'original_games': original_games or games_played
         }
-        self.save_database()
+        self._store_vector(player_name, percentages)
+        self._dirty = True
+    
+    def add_players_bulk(self, players: Iterable[Tuple]):
+        """Add many players, given as add_player argument tuples, and save once."""
+        for player_args in players:
+            self.add_player(*player_args)
+        self.flush()
     
     def get_player(self, player_name: str) -> Optional[Dict[str, any]]:
         """Get a player's data from the database."""
@@ -314,6 +424,53 @@ class PlayerDatabase:
                 result[player_name] = player_data
         return result
     
+    def get_player_vectors(self, zones: List[str]) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+        """Get every player's percentages as a (players, zones) float32 matrix, its row norms and names.
+        
+        For the standard zones these are views of the stored matrix, valid until the next
+        add or remove; other zone lists are gathered on the spot.
+        """
+        if list(zones) == self.standard_zones:
+            n_players = len(self._names)
+            return self._percentages[:n_players], self._norms[:n_players], list(self._names)
+        
+        all_players = self.get_all_players()
+        vectors = np.array([[percentages.get(zone, 0.0) for zone in zones]
+                            for percentages in all_players.values()], dtype=np.float32)
+        vectors = vectors.reshape(len(all_players), len(zones))
+        return vectors, np.sqrt(np.einsum('ij,ij->i', vectors, vectors)), list(all_players.keys())
+    
+    def _store_vector(self, player_name: str, percentages: Dict[str, float]):
+        """Write a player's percentages into their matrix row, appending a row for new players."""
+        row = self._name_to_idx.get(player_name)
+        if row is None:
+            row = len(self._names)
+            if row == len(self._percentages):
+                # Out of spare rows: double the capacity
+                capacity = max(16, 2 * row)
+                percentages_store = np.zeros((capacity, len(self.standard_zones)), dtype=np.float32)
+                percentages_store[:row] = self._percentages[:row]
+                norms_store = np.zeros(capacity, dtype=np.float32)
+                norms_store[:row] = self._norms[:row]
+                self._percentages, self._norms = percentages_store, norms_store
+            self._names.append(player_name)
+            self._name_to_idx[player_name] = row
+        
+        vector = self._percentages[row]
+        for z, zone in enumerate(self.standard_zones):
+            vector[z] = percentages.get(zone, 0.0)
+        self._norms[row] = np.sqrt(np.vdot(vector, vector))
+    
+    def _drop_vector(self, player_name: str):
+        """Remove a player's row, shifting later rows up so order still follows self.data."""
+        row = self._name_to_idx.pop(player_name)
+        n_players = len(self._names)
+        self._percentages[row:n_players - 1] = self._percentages[row + 1:n_players]
+        self._norms[row:n_players - 1] = self._norms[row + 1:n_players]
+        del self._names[row]
+        for i in range(row, n_players - 1):
+            self._name_to_idx[self._names[i]] = i
+    
     def get_all_players_made_shots(self) -> Dict[str, Dict[str, int]]:
         """Get all players made shots data."""
         result = {}
@@ -326,7 +483,8 @@ class PlayerDatabase:
         """Remove a player from the database."""
         if player_name in self.data:
             del self.data[player_name]
-            self.save_database()
+            self._drop_vector(player_name)
+            self._dirty = True
     
     @staticmethod
     def scale_stats_to_games(made_shots: Dict[str, int], attempts: Dict[str, int], 
@@ -337,14 +495,12 @@ class PlayerDatabase:
         
         scale_factor = target_games / original_games
         
-        scaled_made = {}
-        scaled_attempts = {}
+        # Scale each dict's zones in one rounded multiply (np.rint rounds half to even, like round)
+        made_values = np.fromiter(made_shots.values(), dtype=np.float64, count=len(made_shots))
+        attempt_values = np.fromiter(attempts.values(), dtype=np.float64, count=len(attempts))
         
-        for zone in made_shots:
-            scaled_made[zone] = round(made_shots[zone] * scale_factor)
-            
-        for zone in attempts:
-            scaled_attempts[zone] = round(attempts[zone] * scale_factor)
+        scaled_made = dict(zip(made_shots, np.rint(made_values * scale_factor).astype(np.int64).tolist()))
+        scaled_attempts = dict(zip(attempts, np.rint(attempt_values * scale_factor).astype(np.int64).tolist()))
         
         return scaled_made, scaled_attempts
     
@@ -374,6 +530,12 @@ class PlayerDatabase:
             target_games, 
             original_games
         )
+    
+    def add_players_with_scaling_bulk(self, players: Iterable[Tuple]):
+        """Add many players, given as add_player_with_scaling argument tuples, and save once."""
+        for player_args in players:
+            self.add_player_with_scaling(*player_args)
+        self.flush()
 
 
 if __name__ == "__main__":
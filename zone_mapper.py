@@ -1,32 +1,77 @@
 import re
+from functools import cached_property
 from typing import Dict, List, Tuple, Optional
 import numpy as np
 
 
+def _read_only(array: np.ndarray) -> np.ndarray:
+    """Mark a shared class-level array as read-only and return it."""
+    array.setflags(write=False)
+    return array
+
+
+def _build_zone_grid(zone_bounds: np.ndarray) -> Tuple[Tuple[int, int], np.ndarray]:
+    """Rasterize zone boxes into a per-pixel zone index grid (-1 = no zone).
+    
+    The grid covers the box spanning every zone and starts at the returned (x, y) origin.
+    Zones are painted last-first so the first matching zone wins, as in the bounds scan.
+    """
+    origin = (int(zone_bounds[:, 0].min()), int(zone_bounds[:, 2].min()))
+    ox, oy = origin
+    grid = np.full((int(zone_bounds[:, 3].max()) - oy + 1,
+                    int(zone_bounds[:, 1].max()) - ox + 1), -1, dtype=np.int8)
+    for i in range(len(zone_bounds) - 1, -1, -1):
+        x0, x1, y0, y1 = zone_bounds[i].tolist()
+        grid[y0 - oy:y1 - oy + 1, x0 - ox:x1 - ox + 1] = i
+    return origin, _read_only(grid)
+
+
 class ShotZoneMapper:
     """Maps OCR extracted text to basketball shot zones based on coordinates."""
     
-    def __init__(self):
-        # Define shot zones with correct bounding boxes based on actual OCR analysis
-        # These coordinates are calibrated for the actual shot chart images
-        self.shot_zones = {
-            'Left Corner 3': {'x_range': (50, 120), 'y_range': (20, 80)},
-            'Right Corner 3': {'x_range': (650, 720), 'y_range': (20, 80)},
-            'Left Wing 3': {'x_range': (80, 130), 'y_range': (350, 420)},
-            'Right Wing 3': {'x_range': (610, 660), 'y_range': (350, 420)},
-            'Top of Key 3': {'x_range': (350, 400), 'y_range': (480, 550)},
-            'Left Mid Range': {'x_range': (170, 210), 'y_range': (100, 160)},
-            'Right Mid Range': {'x_range': (540, 580), 'y_range': (100, 160)},
-            'Left Free Throw': {'x_range': (270, 320), 'y_range': (240, 310)},
-            'Right Free Throw': {'x_range': (430, 480), 'y_range': (240, 310)},
-            'Paint': {'x_range': (300, 440), 'y_range': (20, 40)},
-        }
-        
-        # Standard shot zones in order for radar chart
-        self.standard_zones = [
-            'Left Corner 3', 'Left Wing 3', 'Top of Key 3', 'Right Wing 3', 'Right Corner 3',
-            'Left Mid Range', 'Left Free Throw', 'Right Free Throw', 'Right Mid Range', 'Paint'
-        ]
+    # Stat formats, compiled once; groups capture the numbers and surrounding whitespace is allowed
+    MADE_ATTEMPTS_PATTERN = re.compile(r'^\s*(\d+)/(\d+)\s*$')  # e.g. '27/70'
+    PERCENTAGE_PATTERN = re.compile(r'^\s*(\d+\.?\d*)%\s*$')  # e.g. '38.6%'
+    
+    # Standard shot zones in order for radar chart
+    standard_zones = (
+        'Left Corner 3', 'Left Wing 3', 'Top of Key 3', 'Right Wing 3', 'Right Corner 3',
+        'Left Mid Range', 'Left Free Throw', 'Right Free Throw', 'Right Mid Range', 'Paint'
+    )
+    
+    # Define shot zones with correct bounding boxes based on actual OCR analysis
+    # These coordinates are calibrated for the actual shot chart images
+    # Zone boxes are (x0, x1, y0, y1) rows aligned with zone_names; row order is match priority.
+    # All zone data is built once here and shared read-only by every mapper
+    zone_names = (
+        'Left Corner 3', 'Right Corner 3', 'Left Wing 3', 'Right Wing 3', 'Top of Key 3',
+        'Left Mid Range', 'Right Mid Range', 'Left Free Throw', 'Right Free Throw', 'Paint'
+    )
+    zone_bounds = _read_only(np.array([
+        [50, 120, 20, 80],     # Left Corner 3
+        [650, 720, 20, 80],    # Right Corner 3
+        [80, 130, 350, 420],   # Left Wing 3
+        [610, 660, 350, 420],  # Right Wing 3
+        [350, 400, 480, 550],  # Top of Key 3
+        [170, 210, 100, 160],  # Left Mid Range
+        [540, 580, 100, 160],  # Right Mid Range
+        [270, 320, 240, 310],  # Left Free Throw
+        [430, 480, 240, 310],  # Right Free Throw
+        [300, 440, 20, 40],    # Paint
+    ], dtype=np.int32))
+    
+    # Zone centers as (x, y) rows
+    zone_centers = _read_only(np.column_stack([(zone_bounds[:, 0] + zone_bounds[:, 1]) / 2,
+                                               (zone_bounds[:, 2] + zone_bounds[:, 3]) / 2]))
+    
+    # Per-pixel zone index so integer points resolve with one array read
+    grid_origin, zone_grid = _build_zone_grid(zone_bounds)
+    
+    @cached_property
+    def shot_zones(self) -> Dict[str, Dict]:
+        """Zones as {name: {'x_range': (x0, x1), 'y_range': (y0, y1)}}, built from zone_bounds on first use."""
+        return {name: {'x_range': (x0, x1), 'y_range': (y0, y1)}
+                for name, (x0, x1, y0, y1) in zip(self.zone_names, self.zone_bounds.tolist())}
     
     def point_in_zone(self, x: int, y: int, zone_bounds: Dict) -> bool:
         """Check if a point (x, y) falls within a zone's boundaries."""
@@ -37,113 +82,160 @@ class ShotZoneMapper:
     
     def get_zone_for_coordinate(self, x: int, y: int) -> Optional[str]:
         """Get the shot zone for given coordinates."""
-        for zone_name, zone_bounds in self.shot_zones.items():
-            if self.point_in_zone(x, y, zone_bounds):
-                return zone_name
+        if isinstance(x, (int, np.integer)) and isinstance(y, (int, np.integer)):
+            gx, gy = x - self.grid_origin[0], y - self.grid_origin[1]
+            height, width = self.zone_grid.shape
+            if 0 <= gx < width and 0 <= gy < height:
+                first = int(self.zone_grid[gy, gx])
+                if first >= 0:
+                    return self.zone_names[first]
+            return self.get_closest_zone(x, y)
+        
+        bounds = self.zone_bounds
+        inside = (bounds[:, 0] <= x) & (x <= bounds[:, 1]) & (bounds[:, 2] <= y) & (y <= bounds[:, 3])
+        first = int(inside.argmax())
+        if inside[first]:
+            return self.zone_names[first]
         
         # If no exact match, find the closest zone
         return self.get_closest_zone(x, y)
     
+    def get_zones_for_coordinates(self, xs: List[int], ys: List[int]) -> List[str]:
+        """Get the shot zone for many coordinates at once (same rules as get_zone_for_coordinate)."""
+        xs = np.asarray(xs)[:, None]
+        ys = np.asarray(ys)[:, None]
+        bounds = self.zone_bounds
+        centers = self.zone_centers
+        squared_distances = (centers[:, 0] - xs) ** 2 + (centers[:, 1] - ys) ** 2
+        
+        if xs.dtype.kind in 'iu' and ys.dtype.kind in 'iu':
+            # Integer points read the zone grid; points off it or on no zone take the nearest center
+            gx = xs[:, 0] - self.grid_origin[0]
+            gy = ys[:, 0] - self.grid_origin[1]
+            height, width = self.zone_grid.shape
+            on_grid = (0 <= gx) & (gx < width) & (0 <= gy) & (gy < height)
+            grid_indices = np.full(len(gx), -1, dtype=np.intp)
+            grid_indices[on_grid] = self.zone_grid[gy[on_grid], gx[on_grid]]
+            zone_indices = np.where(grid_indices >= 0, grid_indices, squared_distances.argmin(axis=1))
+            return [self.zone_names[i] for i in zone_indices.tolist()]
+        
+        # (points, zones) containment; points outside every zone take the nearest center
+        inside = (bounds[:, 0] <= xs) & (xs <= bounds[:, 1]) & (bounds[:, 2] <= ys) & (ys <= bounds[:, 3])
+        zone_indices = np.where(inside.any(axis=1), inside.argmax(axis=1), squared_distances.argmin(axis=1))
+        
+        return [self.zone_names[i] for i in zone_indices.tolist()]
+    
     def get_closest_zone(self, x: int, y: int) -> str:
         """Find the closest zone to given coordinates."""
-        min_distance = float('inf')
-        closest_zone = 'Paint'  # Default fallback
-        
-        for zone_name, zone_bounds in self.shot_zones.items():
-            # Calculate distance to zone center
-            x_center = (zone_bounds['x_range'][0] + zone_bounds['x_range'][1]) / 2
-            y_center = (zone_bounds['y_range'][0] + zone_bounds['y_range'][1]) / 2
-            
-            distance = np.sqrt((x - x_center)**2 + (y - y_center)**2)
-            
-            if distance < min_distance:
-                min_distance = distance
-                closest_zone = zone_name
+        # Squared distance to every zone center; the first nearest zone wins
+        centers = self.zone_centers
+        squared_distances = (centers[:, 0] - x) ** 2 + (centers[:, 1] - y) ** 2
         
-        return closest_zone
+        return self.zone_names[int(squared_distances.argmin())]
     
     def is_made_attempts(self, text: str) -> bool:
         """Check if text is in made/attempts format (e.g., '27/70')."""
-        return bool(re.match(r'^\d+/\d+$', text.strip()))
+        return bool(self.MADE_ATTEMPTS_PATTERN.match(text))
     
     def is_percentage(self, text: str) -> bool:
         """Check if text is a percentage (e.g., '38.6%')."""
-        return bool(re.match(r'^\d+\.?\d*%$', text.strip()))
+        return bool(self.PERCENTAGE_PATTERN.match(text))
     
     def parse_made_attempts(self, text: str) -> Tuple[int, int]:
         """Parse made/attempts text into tuple of (made, attempts)."""
-        if self.is_made_attempts(text):
-            made, attempts = text.split('/')
-            return int(made), int(attempts)
+        match = self.MADE_ATTEMPTS_PATTERN.match(text)
+        if match:
+            return int(match.group(1)), int(match.group(2))
         return 0, 0
     
     def parse_percentage(self, text: str) -> float:
         """Parse percentage text into float value."""
-        if self.is_percentage(text):
-            return float(text.replace('%', ''))
+        match = self.PERCENTAGE_PATTERN.match(text)
+        if match:
+            return float(match.group(1))
         return 0.0
     
+    def _classify(self, text: str) -> Tuple:
+        """Classify OCR text with one match per pattern.
+        
+        Returns ('ma', made, attempts), ('pct', value) or ('other',).
+        """
+        match = self.MADE_ATTEMPTS_PATTERN.match(text)
+        if match:
+            return 'ma', int(match.group(1)), int(match.group(2))
+        match = self.PERCENTAGE_PATTERN.match(text)
+        if match:
+            return 'pct', float(match.group(1))
+        return ('other',)
+    
     def group_stats_by_proximity(self, ocr_results: List[Dict], proximity_threshold: int = 100) -> List[List[Dict]]:
-        """Group OCR results that are close to each other (likely same zone stats)."""
+        """Group OCR results that are close to each other (likely same zone stats).
+        
+        Each ungrouped result, in order, seeds a group of every ungrouped result within the
+        threshold of that seed.
+        """
+        if not ocr_results:
+            return []
+        
+        # All pairwise "within threshold" tests at once, on squared distances
+        xs = np.array([result['center_x'] for result in ocr_results])
+        ys = np.array([result['center_y'] for result in ocr_results])
+        squared_distances = (xs[:, None] - xs[None, :]) ** 2 + (ys[:, None] - ys[None, :]) ** 2
+        close = squared_distances <= proximity_threshold ** 2
+        
         groups = []
-        used_indices = set()
+        used = np.zeros(len(ocr_results), dtype=bool)
         
-        for i, result in enumerate(ocr_results):
-            if i in used_indices:
+        for i in range(len(ocr_results)):
+            if used[i]:
                 continue
-                
-            group = [result]
-            used_indices.add(i)
             
-            for j, other_result in enumerate(ocr_results):
-                if j in used_indices:
-                    continue
-                    
-                # Calculate distance between centers
-                distance = np.sqrt(
-                    (result['center_x'] - other_result['center_x'])**2 + 
-                    (result['center_y'] - other_result['center_y'])**2
-                )
-                
-                if distance <= proximity_threshold:
-                    group.append(other_result)
-                    used_indices.add(j)
-            
-            groups.append(group)
+            # Earlier results are all used by now, so the seed comes first in index order
+            members = np.flatnonzero(close[i] & ~used)
+            used[members] = True
+            groups.append([ocr_results[j] for j in members])
         
         return groups
     
-    def extract_zone_stats(self, group: List[Dict]) -> Dict:
-        """Extract statistics from a group of OCR results in the same zone."""
+    def extract_zone_stats(self, group: List[Dict], zone: Optional[str] = None) -> Dict:
+        """Extract statistics from a group of OCR results in the same zone.
+        
+        Pass zone when it is already known for the group's first result. Coordinates come
+        back as an (n, 2) int array of (center_x, center_y) rows.
+        """
         zone_stat = {
             'made': 0,
             'attempts': 0,
             'percentage': 0.0,
             'zone': None,
-            'coordinates': []
+            'coordinates': np.empty((len(group), 2), dtype=np.int32)
         }
+        coordinates = zone_stat['coordinates']
         
         # Determine zone based on the first coordinate in the group
-        if group:
+        if zone is not None:
+            zone_stat['zone'] = zone
+        elif group:
             first_coord = group[0]
             zone_stat['zone'] = self.get_zone_for_coordinate(
                 first_coord['center_x'], 
                 first_coord['center_y']
             )
         
-        for result in group:
-            zone_stat['coordinates'].append((result['center_x'], result['center_y']))
+        for i, result in enumerate(group):
+            coordinates[i] = result['center_x'], result['center_y']
             
-            if self.is_made_attempts(result['text']):
-                made, attempts = self.parse_made_attempts(result['text'])
+            kind = self._classify(result['text'])
+            if kind[0] == 'ma':
+                _, made, attempts = kind
                 zone_stat['made'] = made
                 zone_stat['attempts'] = attempts
                 # Calculate percentage if not already provided
                 if attempts > 0 and zone_stat['percentage'] == 0.0:
                     zone_stat['percentage'] = (made / attempts) * 100
                     
-            elif self.is_percentage(result['text']):
-                zone_stat['percentage'] = self.parse_percentage(result['text'])
+            elif kind[0] == 'pct':
+                zone_stat['percentage'] = kind[1]
         
         return zone_stat
     
@@ -152,10 +244,14 @@ class ShotZoneMapper:
         # Group nearby OCR results
         groups = self.group_stats_by_proximity(ocr_results)
         
+        # Classify every group's first coordinate in one batch
+        group_zones = self.get_zones_for_coordinates([group[0]['center_x'] for group in groups],
+                                                     [group[0]['center_y'] for group in groups])
+        
         zone_data = {}
         
-        for group in groups:
-            zone_stat = self.extract_zone_stats(group)
+        for group, group_zone in zip(groups, group_zones):
+            zone_stat = self.extract_zone_stats(group, group_zone)
             zone_name = zone_stat['zone']
             
             if zone_name and (zone_stat['made'] > 0 or zone_stat['percentage'] > 0):
@@ -170,52 +266,35 @@ class ShotZoneMapper:
         
         return zone_data
     
-    def get_normalized_zone_percentages(self, zone_data: Dict[str, Dict]) -> Dict[str, float]:
-        """Convert zone data to normalized percentages for radar chart."""
-        normalized_data = {}
+    def _normalize_field(self, zone_data: Dict[str, Dict], key: str, default) -> Dict:
+        """Pull one field per standard zone, in standard order, defaulting missing zones."""
+        normalized_data = dict.fromkeys(self.standard_zones, default)
         
-        for zone in self.standard_zones:
-            if zone in zone_data:
-                percentage = zone_data[zone].get('percentage', 0.0)
-                normalized_data[zone] = percentage
-            else:
-                normalized_data[zone] = 0.0
+        for zone, stats in zone_data.items():
+            if zone in normalized_data:
+                normalized_data[zone] = stats.get(key, default)
         
         return normalized_data
+    
+    def get_normalized_zone_percentages(self, zone_data: Dict[str, Dict]) -> Dict[str, float]:
+        """Convert zone data to normalized percentages for radar chart."""
+        return self._normalize_field(zone_data, 'percentage', 0.0)
 
     def get_normalized_zone_made_shots(self, zone_data: Dict[str, Dict]) -> Dict[str, int]:
         """Convert zone data to normalized made shot counts for radar chart."""
-        normalized_data = {}
-        
-        for zone in self.standard_zones:
-            if zone in zone_data:
-                made_shots = zone_data[zone].get('made', 0)
-                normalized_data[zone] = made_shots
-            else:
-                normalized_data[zone] = 0
-        
-        return normalized_data
+        return self._normalize_field(zone_data, 'made', 0)
 
     def get_normalized_zone_attempts(self, zone_data: Dict[str, Dict]) -> Dict[str, int]:
         """Convert zone data to normalized attempt counts for radar chart."""
-        normalized_data = {}
-        
-        for zone in self.standard_zones:
-            if zone in zone_data:
-                attempts = zone_data[zone].get('attempts', 0)
-                normalized_data[zone] = attempts
-            else:
-                normalized_data[zone] = 0
-        
-        return normalized_data
+        return self._normalize_field(zone_data, 'attempts', 0)
 
 
 if __name__ == "__main__":
     # Test the zone mapper
-    from ocr_extractor import ShotChartOCR
+    from ocr_extractor import get_shared_ocr
     
     # Extract OCR data
-    ocr = ShotChartOCR()
+    ocr = get_shared_ocr()
     ocr_results = ocr.extract_basketball_stats("shot_charts/marina_mabrey.jpeg")
     
     # Map to zones